@@ -30,11 +30,8 @@ then
     # Start production server
     echo "Starting production server..."
     exec gunicorn config.asgi:application \
-        --workers 4 \
-        --worker-class uvicorn.workers.UvicornWorker \
         --bind 0.0.0.0:8000 \
         --timeout 120 \
-        --keep-alive 2 \
         --max-requests 1000 \
         --max-requests-jitter 100 \
         --log-level info \
@@ -1,11 +1,22 @@
 import logging
+import multiprocessing
+import os
+
+# ASGI workers; uvicorn[standard] provides uvloop and httptools, which the
+# worker's "auto" loop/http settings pick up when installed
+worker_class = "uvicorn.workers.UvicornWorker"
+# Override with GUNICORN_WORKERS to stay within the database connection limit
+workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+keepalive = 5
 
 # Disable Gunicorn access log entirely
 accesslog = None
 
-class DropAll(logging.Filter):
-	def filter(self, record: logging.LogRecord) -> bool:
-		return False
-
-def on_starting(server):
-	logging.getLogger("uvicorn.access").addFilter(DropAll())
+def post_worker_init(worker):
+	# Runs after the app is loaded: Django's logging dictConfig re-enables
+	# existing loggers, so disabling earlier (on_starting) would not stick.
+	# A disabled logger returns before any LogRecord is built.
+	access_logger = logging.getLogger("uvicorn.access")
+	access_logger.disabled = True
+	access_logger.propagate = False
+	access_logger.handlers.clear()